@@ -0,0 +1,42 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+scheduler_core.pyx — optional compiled kernels for zlp_scheduler.py.
+
+Build in place (next to zlp_scheduler.py) with:
+
+    pip install cython
+    cythonize -i scheduler_core.pyx
+
+Day conflict masks arrive as flat uint64 words, `words` per day, low word
+first — the layout mask_words() builds.  Any buffer of unsigned long
+long works; zlp_scheduler.py passes array('Q').
+"""
+
+cdef extern from *:
+    int __builtin_popcountll(unsigned long long) nogil
+
+def score_rows(const unsigned long long[:] busy, const unsigned long long[:] cands,
+               rows, int days, int words, int slots):
+    """Free-window total of each candidate in rows; busy is days*words words."""
+    cdef Py_ssize_t r, j, base, n = days*words
+    cdef long total
+    out = []
+    for r in rows:
+        base = r*n
+        total = days*slots
+        for j in range(n):
+            total -= __builtin_popcountll(busy[j] | cands[base+j])
+        out.append(total)
+    return out
+
+def conflict_counts(const unsigned long long[:] day, int words, int slots):
+    """Per window start, how many of the day's masks (words each) block it."""
+    cdef Py_ssize_t i, k, n = day.shape[0]//words
+    cdef int cnt
+    out = []
+    for k in range(slots):
+        cnt = 0
+        for i in range(n):
+            cnt += (day[i*words + (k>>6)] >> (k&63)) & 1
+        out.append(cnt)
+    return out
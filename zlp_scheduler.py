@@ -9,7 +9,8 @@ for the Zachry Leadership Program.
 When a course offers multiple sections, the script chooses
 **one** section — the one that preserves the greatest number of class windows
 after it is added to the schedule.  Courses with only one section are locked
-first.  The algorithm is a fast greedy heuristic:
+first.  If there are at most EXACT_LIMIT section combinations they are all
+searched exactly; otherwise the algorithm is a fast greedy heuristic:
 
     1. Add all single-option courses to the busy grid.
     2. While multi-option courses remain:
@@ -22,10 +23,14 @@ start time(s) per day **and** which classes cause those conflicts.
 """
 
 from __future__ import annotations
-import re
+import csv
+import sys
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from math import prod
 from pathlib import Path
-from typing import Dict, List, Tuple
-from copy import deepcopy
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 # ═════════════════════ constants ════════════════════════════════════════
 DAY_LETTERS = "MTWRF"
@@ -36,15 +41,17 @@ GRID_START, GRID_END = 8*60, 16*60 + 10        # 08:00–16:10 grid for study sl
 BLOCK_LEN   = 100                              # 100-minute window
 STEP_MIN    = 5                                # 5-minute grid
 
-CRS_RE  = re.compile(r"^[A-Z]{4}$")
-NUM_RE  = re.compile(r"^\d{3}[Ll]?$")
-TIME_RE = re.compile(r"^(2[0-3]|1\d|0\d):([0-5]\d)$")
-DAYS_RE = re.compile(r"^[MTWRF]+$", re.I)
+# Day grid as an int bitmask: bit k = the window starting GRID_START+5k.
+# A section's mask marks every window it conflicts with, so free = 0 bits.
+SLOTS       = (GRID_END-GRID_START)//STEP_MIN + 1   # 99 window starts
+WORD_BITS   = 64
+WORDS       = -(-SLOTS//WORD_BITS)                 # uint64 words per day mask
 
 DEFAULT_SHEET = "sections.xlsx"
 
-# Toggle: print all tied-best candidates before locking one in.
-SHOW_TIED_CHOICES = False
+# Search every section combination exactly when there are at most this many;
+# larger inputs fall back to the greedy heuristic.
+EXACT_LIMIT = 100_000
 
 # ═════════════════════ helpers ══════════════════════════════════════════
 def to_minutes(hhmm: str) -> int:
@@ -53,50 +60,89 @@ def to_minutes(hhmm: str) -> int:
 def to_hhmm(m: int) -> str:
     return f"{m//60:02d}:{m%60:02d}"
 
-def overlaps(a:Tuple[int,int], b:Tuple[int,int]) -> bool:
-    return max(a[0],b[0]) < min(a[1],b[1])     # half-open
-
-def merge(intvs: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
-    """Return a list of non-overlapping (start, end) tuples."""
-    merged: List[Tuple[int, int]] = []
-    for s, e in sorted(intvs):
-        if not merged or s > merged[-1][1]:
-            merged.append((s, e))
-        else:
-            merged[-1] = (merged[-1][0], max(merged[-1][1], e))
-    return merged
-
-def free_and_min_conflict(day:List[Tuple[int,int]]):
-    """Return (free blocks, starts with least overlaps, min overlap count) for merged grid."""
+def is_hhmm(s: str) -> bool:
+    """True for a 24-hour "HH:MM" string, 00:00-23:59."""
+    return (len(s)==5 and s[2]==":" and s.isascii()
+            and s[:2].isdigit() and s[3:].isdigit()
+            and int(s[:2])<24 and int(s[3:])<60)
+
+if sys.version_info >= (3, 10):
+    popcount = int.bit_count                   # C popcount (POPCNT where available)
+else:
+    def popcount(x: int) -> int:
+        return bin(x).count("1")
+
+def conflict_mask(st:int, dur:int) -> int:
+    """Return the bitmask of window starts whose block overlaps [st, st+dur)."""
+    lo=max(0, (st-BLOCK_LEN-GRID_START)//STEP_MIN + 1)
+    hi=min(SLOTS, -((GRID_START-st-dur)//STEP_MIN))
+    return ((1<<(hi-lo))-1) << lo if hi>lo else 0
+
+def day_masks(sec:Tuple[str,int,int,str]) -> Tuple[int, ...]:
+    """Return one section's conflict mask per DAY_LETTERS day (0 on days it doesn't meet)."""
+    days,st,dur,_=sec
+    m=conflict_mask(st,dur)
+    return tuple(m if d in days else 0 for d in DAY_LETTERS)
+
+def mask_words(masks) -> array:
+    """Pack day masks into a flat array('Q'), WORDS uint64 words each, low word first."""
+    words=array('Q',b"".join(m.to_bytes(WORDS*WORD_BITS//8,"little") for m in masks))
+    if sys.byteorder=="big":
+        words.byteswap()
+    return words
+
+@lru_cache(maxsize=None)
+def load_core():
+    """The built scheduler_core extension (scheduler_core.pyx), or None; imported on first use."""
+    try:
+        import scheduler_core
+    except ImportError:
+        return None
+    return scheduler_core
+
+def free_and_min_conflict(day:List[int]):
+    """Return (free blocks, starts with least overlaps, min overlap count) for conflict masks."""
+    core=load_core()
+    if core is not None:
+        counts=core.conflict_counts(mask_words(day),WORDS,SLOTS)
+    else:
+        day_mask=0
+        for iv in day:
+            day_mask|=iv
+        counts=[sum((iv>>k)&1 for iv in day) if (day_mask>>k)&1 else 0
+                for k in range(SLOTS)]
     free,best,mincnt=[],[],float('inf')
-    for st in range(GRID_START, GRID_END+1, STEP_MIN):
-        blk=(st, st+BLOCK_LEN)
-        cnt=sum(1 for iv in day if overlaps(blk,iv))
-        if cnt==0: free.append(blk)
+    for k,cnt in enumerate(counts):
+        st=GRID_START+k*STEP_MIN
+        if cnt==0: free.append((st, st+BLOCK_LEN))
         if cnt<mincnt:
             mincnt,best=cnt,[st]
         elif cnt==mincnt:
             best.append(st)
     return free,best,mincnt
 
-def offenders_for_start(st:int, day_labeled:List[Tuple[int,int,str]])->List[Tuple[str,int,int]]:
-    """Return all (code, start_min, end_min) classes overlapping a block."""
-    blk=(st, st+BLOCK_LEN)
-    hits=[]
-    for s,e,code in day_labeled:
-        if overlaps((s,e), blk):
-            hits.append((code, s, e))
-    hits.sort(key=lambda x: x[1])
-    return hits
-
-def min_conflict_by_labels(day_labeled:List[Tuple[int,int,str]])->Tuple[List[int],int]:
+def day_index(day_labeled:List[Tuple[int,int,str]])->Tuple[List[int],int]:
+    """Start list and longest duration of a start-sorted labeled day, for bisect."""
+    return [s for s,_,_ in day_labeled], max((e-s for s,e,_ in day_labeled), default=0)
+
+def offenders_for_start(st:int, day_labeled:List[Tuple[int,int,str]],
+                        index:Optional[Tuple[List[int],int]]=None)->List[Tuple[str,int,int]]:
+    """Return all (code, start_min, end_min) classes overlapping a block, by start."""
+    starts,longest = index or day_index(day_labeled)
+    lo=bisect_right(starts, st-longest)          # earlier classes end by st
+    hi=bisect_left(starts, st+BLOCK_LEN)
+    return [(code,s,e) for s,e,code in day_labeled[lo:hi] if e>st]
+
+def min_conflict_by_labels(day_labeled:List[Tuple[int,int,str]],
+                           index:Optional[Tuple[List[int],int]]=None)->Tuple[List[int],int]:
     """
     Using the *labeled* grid (no merging), find starts with the true minimum
     number of conflicting classes. Returns (best_starts, min_conflict_count).
     """
+    index = index or day_index(day_labeled)
     best, mincnt = [], float('inf')
     for st in range(GRID_START, GRID_END+1, STEP_MIN):
-        cnt = sum(1 for s,e,_ in day_labeled if overlaps((s,e), (st, st+BLOCK_LEN)))
+        cnt = len(offenders_for_start(st, day_labeled, index))
         if cnt < mincnt:
             mincnt, best = cnt, [st]
         elif cnt == mincnt:
@@ -104,32 +150,56 @@ def min_conflict_by_labels(day_labeled:List[Tuple[int,int,str]])->Tuple[List[int
     return best, mincnt
 
 # ═════════════ Excel / CSV loader ═══════════════════════════════════════
+def clean_row(subj:str,num:str,days:str,start:str,dur:str)->tuple[str,str,str,str,str]:
+    """Normalize one row's cell text into the 5-field tuple add_section expects."""
+    whole,dot,frac=dur.partition(".")
+    if dot and whole and not frac.strip("0"):
+        dur=whole                               # exported floats like "50.0"
+    return (subj.upper(),num,days.upper(),start,dur)   # dur checked by add_section
+
+def cell_text(v)->str:
+    """Return a worksheet cell as stripped text (whole floats like 221.0 -> "221")."""
+    if v is None:
+        return ""
+    if isinstance(v,float) and v.is_integer():
+        v=int(v)
+    return str(v).strip()
+
 def rows_from_file(path:str)->list[tuple[str,str,str,str,str]]:
-    import pandas as pd
     p=Path(path)
-    if p.suffix.lower() in {".xlsx",".xls"}:
-        df=pd.read_excel(p,engine="openpyxl")
-    elif p.suffix.lower()==".csv":
-        df=pd.read_csv(p)
-    else:
+    need=["Subject","Number","Days","Start","Duration"]
+    if p.suffix.lower()==".csv":
+        return rows_from_csv(p,need)
+    if p.suffix.lower() not in {".xlsx",".xls"}:
         raise ValueError("file must be .xlsx, .xls, or .csv")
 
-    need=["Subject","Number","Days","Start","Duration"]
-    miss=[c for c in need if c not in df.columns]
-    if miss:
-        raise ValueError(f"missing columns: {', '.join(miss)}")
-
-    rows=[]
-    for _,r in df.iterrows():
-        rows.append((
-            str(r["Subject"]).strip().upper(),
-            str(r["Number"]).strip(),
-            str(r["Days"]).strip().upper(),
-            str(r["Start"]).strip(),
-            str(int(r["Duration"])).strip()
-        ))
+    import openpyxl                             # only Excel needs openpyxl
+    wb=openpyxl.load_workbook(p,read_only=True,data_only=True)
+    try:
+        it=wb.active.iter_rows(values_only=True)   # streamed, no DataFrame
+        header=list(next(it,()))
+        miss=[c for c in need if c not in header]
+        if miss:
+            raise ValueError(f"missing columns: {', '.join(miss)}")
+        idx=[header.index(c) for c in need]
+        rows=[]
+        for vals in it:
+            if all(v is None for v in vals):
+                continue                        # blank / trailing rows
+            rows.append(clean_row(*(cell_text(vals[i]) if i<len(vals) else "" for i in idx)))
+    finally:
+        wb.close()
     return rows
 
+def rows_from_csv(p:Path, need:list[str])->list[tuple[str,str,str,str,str]]:
+    """Read a .csv with the stdlib csv module."""
+    with open(p,newline="",encoding="utf-8-sig") as f:
+        reader=csv.DictReader(f)
+        miss=[c for c in need if c not in (reader.fieldnames or [])]
+        if miss:
+            raise ValueError(f"missing columns: {', '.join(miss)}")
+        return [clean_row(*((r[c] or "").strip() for c in need)) for r in reader]
+
 # ═════════════ validator / inserter ═════════════════════════════════════
 def add_section(parts:tuple[str,str,str,str,str],
                 sections:Dict[str,List[Tuple[str,int,int,str]]],
@@ -138,13 +208,16 @@ def add_section(parts:tuple[str,str,str,str,str],
     code=f"{subj} {num}"
     days=days.upper()
     try:
-        if not CRS_RE.fullmatch(subj) or not NUM_RE.fullmatch(num):
+        # each field is walked once; the first failing field sets the message
+        if not (len(subj)==4 and subj.isascii() and subj.isalpha() and subj.isupper()
+                and len(num) in (3,4) and num.isascii() and num[:3].isdigit()
+                and num[3:] in ("","L","l")):
             raise ValueError("course code malformed (e.g. MEEN 221)")
-        if not DAYS_RE.fullmatch(days):
+        if not days or days.strip(DAY_LETTERS):
             raise ValueError("days must be combo of MTWRF")
-        if not TIME_RE.fullmatch(start):
+        if not is_hhmm(start):
             raise ValueError("start must be HH:MM 24-hour")
-        if not dur.isdigit() or int(dur)<=0:
+        if not (dur.isascii() and dur.isdigit()) or int(dur)<=0:
             raise ValueError("duration must be positive int")
         st=to_minutes(start)
     except ValueError as err:
@@ -154,6 +227,98 @@ def add_section(parts:tuple[str,str,str,str,str],
     if echo: print("Success!")
     return True
 
+# ═════════════════════ section selection ════════════════════════════════
+Section = Tuple[str,int,int,str]                # (days, start_min, dur, code)
+
+def choose_exact(busy_mask:List[int], options:Dict[str,List[Section]])->Dict[str,Section]:
+    """
+    Try every combination of one section per course and return the one that
+    leaves the most free windows (ties -> earliest starts, course by course).
+    Depth-first over courses with prefix ORs; an OR only adds bits, so a
+    branch whose prefix can't beat the best so far is cut.
+    """
+    courses=list(options)
+    choices=[[(sec,day_masks(sec)) for sec in sorted(options[c],key=lambda x:x[1])]
+             for c in courses]
+    best_free,best_pick=-1,[]
+    pick:List[Section]=[]
+
+    def search(level:int, masks:List[int])->None:
+        nonlocal best_free,best_pick
+        free=sum(SLOTS-popcount(b) for b in masks)
+        if free<=best_free:
+            return
+        if level==len(choices):
+            best_free,best_pick=free,pick[:]
+            return
+        for sec,ms in choices[level]:
+            pick.append(sec)
+            search(level+1,[b|m for b,m in zip(masks,ms)])
+            pick.pop()
+
+    search(0,list(busy_mask))
+    return dict(zip(courses,best_pick))
+
+def choose_greedy(busy_mask:List[int], options:Dict[str,List[Section]])->Dict[str,Section]:
+    """Greedy pick: repeatedly lock the section that keeps the most free windows."""
+    busy_mask=list(busy_mask)
+
+    # struct-of-arrays over every candidate section; row r is table[r].
+    # None of it changes during the greedy loop, so it is built once.
+    table     =[(course,cand) for course,lst in options.items() for cand in lst]
+    sec_course=[ci for ci,lst in enumerate(options.values()) for _ in lst]
+    sec_start =[cand[1] for _,cand in table]
+    sec_masks =[day_masks(cand) for _,cand in table]
+    sec_days  =[[di for di,m in enumerate(ms) if m] for ms in sec_masks]   # days it blocks
+    core=load_core()
+    if core is not None:
+        cand_flat=mask_words(m for ms in sec_masks for m in ms)
+
+    def score_round(rows:List[int])->List[int]:
+        """Score the candidates table[rows] against the current busy grid."""
+        if not rows:
+            return []
+        if core is not None:
+            busy=mask_words(busy_mask)
+            return core.score_rows(busy,cand_flat,rows,len(DAY_LETTERS),WORDS,SLOTS)
+        return [sum(SLOTS-popcount(b|m) for b,m in zip(busy_mask,sec_masks[r]))
+                for r in rows]
+
+    chosen={}
+    score=score_round(list(range(len(table))))
+    # Rows in tie-break order (earliest start, then input order).  No score can
+    # exceed the grid's current free count, so the first row reaching it wins.
+    remaining=sorted(range(len(table)), key=lambda r:(sec_start[r], r))
+    free_now=sum(SLOTS-popcount(b) for b in busy_mask)
+    while remaining:
+        i=remaining[0]
+        for r in remaining:
+            if score[r]>score[i]:
+                i=r
+            if score[i]==free_now:
+                break
+        best_course,best_sec=table[i]
+        chosen[best_course]=best_sec
+        lost,closed=0,{}
+        for di in sec_days[i]:                  # only the days this section touches
+            m=sec_masks[i][di]
+            gone=m&~busy_mask[di]               # windows this lock just closed
+            if gone:
+                lost+=popcount(gone)
+                closed[di]=gone
+            busy_mask[di]|=m
+        ci=sec_course[i]
+        remaining=[r for r in remaining if sec_course[r]!=ci]
+        if not closed:
+            continue                            # nothing new blocked; scores stand
+
+        # Every candidate loses the closed windows, minus any it already blocks.
+        free_now-=lost
+        for r in remaining:
+            ms=sec_masks[r]
+            score[r]-=lost-sum(popcount(ms[di]&g) for di,g in closed.items())
+    return chosen
+
 # ═════════════════════ main routine ═════════════════════════════════════
 def main()->None:
     sections:Dict[str,List[Tuple[str,int,int,str]]]={}
@@ -193,53 +358,29 @@ def main()->None:
     mandatory={c:lst[0] for c,lst in sections.items() if len(lst)==1}
     options  ={c:lst[:] for c,lst in sections.items() if len(lst)>1}
 
-    busy={d:[] for d in DAY_LETTERS}
-    busy_raw={d:[] for d in DAY_LETTERS}
-    for days,st,dur,code in mandatory.values():
-        iv=(st,st+dur)
-        for d in days:
-            busy[d].append(iv)
-            busy_raw[d].append((iv[0],iv[1],code))
-    busy={d:merge(v) for d,v in busy.items()}
-
-    def windows_after_add(cand,grid):
-        tmp=deepcopy(grid)
-        days,st,dur,_=cand
-        iv=(st,st+dur)
+    busy_mask=[0]*len(DAY_LETTERS)             # conflict mask per DAY_LETTERS day
+    busy_raw={d:[] for d in DAY_LETTERS}       # labeled, sorted by start
+    for sec in mandatory.values():
+        days,st,dur,code=sec
+        for di,m in enumerate(day_masks(sec)):
+            busy_mask[di]|=m
         for d in days:
-            tmp[d].append(iv)
-            tmp[d]=merge(tmp[d])
-        return sum(len(free_and_min_conflict(tmp[d])[0]) for d in DAY_LETTERS)
+            insort(busy_raw[d],(st,st+dur,code))
 
-    chosen={}
-    while options:
-        best_course=None
-        best_sec=None
-        best_score=-1
-        tied=[]
-        for course,lst in options.items():
-            for cand in lst:
-                score=windows_after_add(cand,busy)
-                if score>best_score or best_sec is None:
-                    best_course,best_sec,best_score=course,cand,score
-                    tied=[(course,cand,score)]
-                elif score==best_score:
-                    tied.append((course,cand,score))
-                    if cand[1]<best_sec[1]:
-                        best_course,best_sec=course,cand
-        chosen[best_course]=best_sec
-        days,st,dur,code=best_sec
-        iv=(st,st+dur)
+    # Small inputs are searched exactly; beyond EXACT_LIMIT use the greedy.
+    if prod(len(lst) for lst in options.values())<=EXACT_LIMIT:
+        chosen=choose_exact(busy_mask,options)
+    else:
+        chosen=choose_greedy(busy_mask,options)
+    for days,st,dur,code in chosen.values():
         for d in days:
-            busy[d].append(iv)
-            busy_raw[d].append((iv[0],iv[1],code))
-        busy={d:merge(v) for d,v in busy.items()}
-        del options[best_course]
+            insort(busy_raw[d],(st,st+dur,code))
 
     free_any=False
     free_by_day,best_by_day={},{}
     for d in DAY_LETTERS:
-        free,best,cnt=free_and_min_conflict(busy[d])  # ok for "free" detection
+        day=[conflict_mask(s,e-s) for s,e,_ in busy_raw[d]]
+        free,best,cnt=free_and_min_conflict(day)  # ok for "free" detection
         free_by_day[d]=free
         best_by_day[d]=(best,cnt)  # kept for reference; not used for min-by-class output
         if free: free_any=True
@@ -254,14 +395,15 @@ def main()->None:
     else:
         # Use labeled grid to compute the TRUE minimum # of conflicting classes.
         for d in DAY_LETTERS:
-            best_starts, mincnt = min_conflict_by_labels(busy_raw[d])
+            index = day_index(busy_raw[d])
+            best_starts, mincnt = min_conflict_by_labels(busy_raw[d], index)
             if not best_starts:
                 continue
 
             # Group only those starts that have exactly that minimum conflict count
             groups: Dict[Tuple[str, ...], Dict[str, object]] = {}
             for s in best_starts:
-                hits = offenders_for_start(s, busy_raw[d])  # [(code, s, e), ...]
+                hits = offenders_for_start(s, busy_raw[d], index)  # [(code, s, e), ...]
                 if len(hits) != mincnt:
                     continue  # safety: should already match
                 codes = tuple(sorted(code for code,_,_ in hits))